@@ -5,18 +5,96 @@ Single file Flask CMS with full admin control
 """
 
 import os
+import re
+import hashlib
+import time
+import random
+import atexit
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import wraps
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, abort
+from functools import wraps, lru_cache
+from itertools import islice
+from types import SimpleNamespace
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, abort, make_response, g
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask_caching import Cache
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload, load_only, deferred, undefer, aliased, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
 import secrets
+import orjson
 
 # =============================================================================
 # FLASK APP CONFIGURATION
 # =============================================================================
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson (C encoder) for jsonify and app.json
+    
+    Calls with stdlib-only arguments (the session serializer passes object_hook
+    and separators) still go through the json module.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SORT_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__)
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', secrets.token_hex(32))
+app.json = ORJSONProvider(app)
+
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+INSTANCE_DIR = os.path.join(BASE_DIR, 'instance')
+os.makedirs(INSTANCE_DIR, exist_ok=True)
+
+
+def load_secret_key():
+    """Read the instance secret key, generating it on first start"""
+    path = os.path.join(INSTANCE_DIR, 'secret.key')
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+    # Write the key to a private temp file and link it into place, so a worker
+    # starting alongside never sees a created-but-empty secret.key
+    key = secrets.token_bytes(32)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    try:
+        os.link(tmp_path, path)
+    except FileExistsError:
+        # Another process published its key first - use that one
+        with open(path, 'rb') as f:
+            key = f.read()
+    finally:
+        os.remove(tmp_path)
+    return key
+
+
+# A persistent key keeps admin sessions valid across restarts when SECRET_KEY is unset
+app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY') or load_secret_key()
 
 # Database Configuration - Support both SQLite (local) and PostgreSQL (production)
 database_url = os.environ.get('DATABASE_URL')
@@ -27,22 +105,77 @@ if database_url:
     if database_url.startswith('postgres://'):
         database_url = database_url.replace('postgres://', 'postgresql://', 1)
     app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+    # Enough pooled connections for every gunicorn thread, recycled before server-side timeouts
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+    }
 else:
     # Development - SQLite
-    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
-    INSTANCE_DIR = os.path.join(BASE_DIR, 'instance')
-    os.makedirs(INSTANCE_DIR, exist_ok=True)
     app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(INSTANCE_DIR, "cms.db")}'
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_pre_ping': True,
+        'connect_args': {'check_same_thread': False},
+    }
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000  # 1 year for static files
+app.config['CACHE_TYPE'] = os.environ.get('CACHE_TYPE', 'SimpleCache')
+app.config['CACHE_DEFAULT_TIMEOUT'] = 60
 
 # Get absolute paths
-BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 UPLOAD_DIR = os.path.join(BASE_DIR, 'static', 'uploads')
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 db = SQLAlchemy(app)
+cache = Cache(app)
+
+# Argon2id for admin passwords; older Werkzeug pbkdf2 hashes are upgraded on login
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+# Verified against when the username is unknown, so that path costs one KDF call too
+_DUMMY_PASSWORD_HASH = password_hasher.hash(secrets.token_hex(16))
+# Login checks run here; caps how many 64MiB argon2 computations run at once
+_kdf_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='kdf')
+
+
+def verify_password_hash(password_hash, password):
+    """Check password against an argon2 or legacy Werkzeug hash"""
+    if not password_hash.startswith('$argon2'):
+        return check_password_hash(password_hash, password)
+    try:
+        return password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers run alongside a writer; NORMAL sync is safe under WAL"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.close()
+
+
+with app.app_context():
+    if db.engine.dialect.name == 'sqlite':
+        event.listen(db.engine, 'connect', _set_sqlite_pragmas)
+
+
+def _raise_on_lazy_loads(orm_execute_state):
+    """Make any relationship not eager-loaded by its query raise instead of lazy loading"""
+    if orm_execute_state.is_select and not orm_execute_state.is_relationship_load:
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload('*'))
+
+
+# Development aid for catching N+1 queries: SQLALCHEMY_RAISELOAD=1 flask run
+if os.environ.get('SQLALCHEMY_RAISELOAD'):
+    event.listen(db.session, 'do_orm_execute', _raise_on_lazy_loads)
 
 # =============================================================================
 # DATABASE MODELS
@@ -52,15 +185,21 @@ class User(db.Model):
     """Admin user model"""
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
-    password_hash = db.Column(db.String(200), nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
     
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        return verify_password_hash(self.password_hash, password)
+    
+    def password_needs_rehash(self):
+        """True for legacy hashes or argon2 hashes made with different parameters"""
+        if not self.password_hash.startswith('$argon2'):
+            return True
+        return password_hasher.check_needs_rehash(self.password_hash)
 
 
 class PageSection(db.Model):
@@ -77,6 +216,10 @@ class PageSection(db.Model):
     order_index = db.Column(db.Integer, default=0)
     is_active = db.Column(db.Boolean, default=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        db.Index('ix_ps_lookup', 'page', 'section_name', 'is_active', 'order_index'),
+    )
 
 
 class BlogCategory(db.Model):
@@ -85,7 +228,7 @@ class BlogCategory(db.Model):
     name = db.Column(db.String(100), unique=True, nullable=False)
     slug = db.Column(db.String(100), unique=True, nullable=False)
     description = db.Column(db.Text)
-    posts = db.relationship('BlogPost', backref='category', lazy=True)
+    posts = db.relationship('BlogPost', backref='category', lazy='select')
 
 
 class BlogPost(db.Model):
@@ -94,7 +237,7 @@ class BlogPost(db.Model):
     title = db.Column(db.String(200), nullable=False)
     slug = db.Column(db.String(200), unique=True, nullable=False)
     excerpt = db.Column(db.Text)
-    content = db.Column(db.Text, nullable=False)
+    content = deferred(db.Column(db.Text, nullable=False))  # only loaded when a page renders it
     featured_image = db.Column(db.String(500))
     author = db.Column(db.String(100), default='Admin')
     category_id = db.Column(db.Integer, db.ForeignKey('blog_category.id'))
@@ -107,6 +250,27 @@ class BlogPost(db.Model):
     published_at = db.Column(db.DateTime)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        db.Index('ix_bp_category_pub', 'category_id', 'is_published', 'id'),
+        db.Index('ix_bp_pub', 'is_published', 'published_at'),
+        db.Index('ix_bp_created', 'created_at'),
+    )
+
+
+class Tag(db.Model):
+    """Distinct blog tags, lowercased; BlogPost.tags stays the display copy"""
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), unique=True, nullable=False)
+
+
+# Posts per tag, led by tag_id so a tag lookup is a primary key range scan
+blog_post_tag = db.Table(
+    'blog_post_tag',
+    db.Column('tag_id', db.Integer, db.ForeignKey('tag.id'), primary_key=True),
+    db.Column('post_id', db.Integer, db.ForeignKey('blog_post.id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_bpt_post', 'post_id'),
+)
 
 
 class Testimonial(db.Model):
@@ -129,6 +293,10 @@ class Testimonial(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     order_index = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        db.Index('ix_t_active_order', 'is_active', 'order_index'),
+    )
 
 
 class TeamMember(db.Model):
@@ -146,6 +314,12 @@ class TeamMember(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Partial index: the About page only ever reads active members in order
+    __table_args__ = (
+        db.Index('ix_tm_active_order', 'order_index',
+                 sqlite_where=is_active == True, postgresql_where=is_active == True),
+    )
+
 
 class Statistic(db.Model):
     """Homepage statistics"""
@@ -156,6 +330,10 @@ class Statistic(db.Model):
     icon = db.Column(db.String(100))  # FontAwesome icon class
     order_index = db.Column(db.Integer, default=0)
     is_active = db.Column(db.Boolean, default=True)
+    
+    __table_args__ = (
+        db.Index('ix_s_active_order', 'is_active', 'order_index'),
+    )
 
 
 class Settings(db.Model):
@@ -176,6 +354,10 @@ class Feature(db.Model):
     image_url = db.Column(db.String(500))
     order_index = db.Column(db.Integer, default=0)
     is_active = db.Column(db.Boolean, default=True)
+    
+    __table_args__ = (
+        db.Index('ix_f_active_order', 'is_active', 'order_index'),
+    )
 
 
 # =============================================================================
@@ -196,10 +378,39 @@ def login_required(f):
 # HELPER FUNCTIONS
 # =============================================================================
 
+# In-process copy of the settings table, reloaded in bulk once it expires
+SETTINGS_CACHE_TTL = 300  # seconds
+_settings_cache = {}
+_settings_cache_expires = 0.0
+
+
+def _load_settings():
+    """Return the cached settings dict, reloading it with one query when stale"""
+    global _settings_cache, _settings_cache_expires
+    if time.monotonic() >= _settings_cache_expires:
+        _settings_cache = dict(db.session.query(Settings.key, Settings.value).all())
+        _settings_cache_expires = time.monotonic() + SETTINGS_CACHE_TTL
+    return _settings_cache
+
+
+# Settings edited on the admin settings page and exposed to every template
+SITE_SETTING_KEYS = (
+    'site_title', 'site_tagline', 'contact_email', 'contact_phone', 'contact_address',
+    'facebook_url', 'twitter_url', 'linkedin_url', 'instagram_url', 'github_url',
+)
+
+
+def get_all_settings(defaults=None):
+    """Get all site settings as a dict, from a single cached lookup"""
+    settings = _load_settings()
+    defaults = defaults or {}
+    return {key: settings.get(key, defaults.get(key, '')) for key in SITE_SETTING_KEYS}
+
+
 def get_setting(key, default=''):
     """Get setting value by key"""
-    setting = Settings.query.filter_by(key=key).first()
-    return setting.value if setting else default
+    settings = _load_settings()
+    return settings[key] if key in settings else default
 
 
 def update_setting(key, value, description=''):
@@ -212,15 +423,370 @@ def update_setting(key, value, description=''):
         setting = Settings(key=key, value=value, description=description)
         db.session.add(setting)
     db.session.commit()
+    _load_settings()[key] = value
+
+
+# Blog view counts are buffered in memory and written in one batch per interval
+VIEW_FLUSH_INTERVAL = 30  # seconds
+_view_buffer = Counter()
+_view_buffer_lock = threading.Lock()
+_view_flusher = None
+
+
+def record_view(post_id):
+    """Buffer a page view and return the number of views not yet written"""
+    with _view_buffer_lock:
+        _view_buffer[post_id] += 1
+        pending = _view_buffer[post_id]
+    _start_view_flusher()
+    return pending
+
+
+def flush_view_counts():
+    """Write buffered view counts to the database in a single transaction"""
+    global _view_buffer
+    with _view_buffer_lock:
+        pending, _view_buffer = _view_buffer, Counter()
+    if not pending:
+        return
+    
+    table = BlogPost.__table__
+    stmt = db.update(table).where(table.c.id == db.bindparam('post_id')).values(
+        views=db.func.coalesce(table.c.views, 0) + db.bindparam('count')
+    )
+    try:
+        db.session.execute(stmt, [{'post_id': post_id, 'count': count} for post_id, count in pending.items()])
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"Error flushing view counts: {e}")
+        with _view_buffer_lock:
+            _view_buffer.update(pending)
+
+
+def _view_flush_loop():
+    while True:
+        time.sleep(VIEW_FLUSH_INTERVAL)
+        with app.app_context():
+            flush_view_counts()
+
+
+def _start_view_flusher():
+    """Start the background flush thread once per process"""
+    global _view_flusher
+    if _view_flusher is not None and _view_flusher.is_alive():
+        return
+    with _view_buffer_lock:
+        if _view_flusher is None or not _view_flusher.is_alive():
+            _view_flusher = threading.Thread(target=_view_flush_loop, name='view-flusher', daemon=True)
+            _view_flusher.start()
+
+
+@atexit.register
+def _flush_views_on_exit():
+    with app.app_context():
+        flush_view_counts()
+
+
+def snapshot(rows):
+    """Copy model rows into plain objects that can be cached across requests"""
+    def copy(row):
+        return SimpleNamespace(**{c.key: getattr(row, c.key) for c in row.__table__.columns})
+    if rows is None:
+        return None
+    if isinstance(rows, list):
+        return [copy(row) for row in rows]
+    return copy(rows)
+
+
+@cache.memoize()
+def _home_payload():
+    return {
+        'hero': snapshot(PageSection.query.filter_by(page='home', section_name='hero', is_active=True).first()),
+        'about_cards': snapshot(PageSection.query.filter_by(page='home', section_name='about_card', is_active=True).order_by(PageSection.order_index).all()),
+        'features': snapshot(Feature.query.filter_by(is_active=True).order_by(Feature.order_index).all()),
+        'stats': snapshot(Statistic.query.filter_by(is_active=True).order_by(Statistic.order_index).all()),
+    }
+
+
+@cache.memoize()
+def _about_payload():
+    # One query for all active members, split into leadership and team here
+    members = snapshot(TeamMember.query.filter_by(is_active=True).order_by(TeamMember.order_index).all())
+    return {
+        'story': snapshot(PageSection.query.filter_by(page='about', section_name='story', is_active=True).first()),
+        'mission': snapshot(PageSection.query.filter_by(page='about', section_name='mission', is_active=True).first()),
+        'vision': snapshot(PageSection.query.filter_by(page='about', section_name='vision', is_active=True).first()),
+        'values': snapshot(PageSection.query.filter_by(page='about', section_name='value', is_active=True).order_by(PageSection.order_index).all()),
+        'leadership': [member for member in members if member.is_leadership],
+        'team': [member for member in members if not member.is_leadership],
+    }
+
+
+@cache.memoize()
+def _testimonials_payload():
+    testimonials = snapshot(Testimonial.query.filter_by(is_active=True).order_by(Testimonial.order_index).all())
+    return {
+        'testimonials': testimonials,
+        'featured': next((t for t in testimonials if t.is_featured), None),
+        'stats': snapshot(Statistic.query.filter_by(is_active=True).order_by(Statistic.order_index).all()),
+    }
+
+
+# Changes whenever the templates are redeployed, so old ETags stop matching
+_TEMPLATE_VERSION = max(
+    (os.path.getmtime(os.path.join(root, name))
+     for root, _, names in os.walk(os.path.join(BASE_DIR, 'templates')) for name in names),
+    default=0,
+)
+
+
+def page_etag(*parts):
+    """ETag over everything a public page renders from, including site settings"""
+    key = repr((_TEMPLATE_VERSION, sorted(_load_settings().items()), parts))
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def render_conditional(etag, template, **context):
+    """Answer 304 when the client already has this version, otherwise render it"""
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = make_response(render_template(template, **context))
+    response.set_etag(etag)
+    return response
+
+
+def rows_version(rows):
+    """Digest of list rows, used to key the {% cache %} fragment that renders them"""
+    return hashlib.blake2b(repr(rows).encode(), digest_size=8).hexdigest()
+
+
+def render_admin_conditional(template, **context):
+    """Admin list page with an ETag over its rows; 304 skips the render on repeat visits
+    
+    context must hold plain row tuples so the ETag reflects the data. Pages carrying
+    flash messages are always rendered and get no ETag, so a flash is never replayed.
+    """
+    if '_flashes' in session:
+        response = make_response(render_template(template, **context))
+    else:
+        response = render_conditional(page_etag(session.get('username'), context), template, **context)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def invalidate_page_cache():
+    """Drop cached public page data after an admin edit"""
+    for payload in (_home_payload, _about_payload, _testimonials_payload):
+        cache.delete_memoized(payload)
+
+
+# Columns needed to render a post in a listing - skips the large content column
+BLOG_LIST_OPTIONS = (
+    load_only(
+        BlogPost.id, BlogPost.title, BlogPost.slug, BlogPost.excerpt, BlogPost.featured_image,
+        BlogPost.author, BlogPost.category_id, BlogPost.published_at, BlogPost.read_time,
+        BlogPost.views, BlogPost.is_published, BlogPost.is_featured
+    ),
+    joinedload(BlogPost.category),
+)
+
+
+_blog_fts_ready = None
+
+
+def blog_fts_available():
+    """True once the SQLite full-text index exists (checked once per process)"""
+    global _blog_fts_ready
+    if _blog_fts_ready is None:
+        _blog_fts_ready = db.engine.dialect.name == 'sqlite' and db.session.execute(db.text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'blog_fts'"
+        )).first() is not None
+    return _blog_fts_ready
+
+
+def search_published_posts(query, limit=10):
+    """(id, title, slug, excerpt) rows of published posts matching query, best match first"""
+    if blog_fts_available():
+        # Quote every term so user input is never parsed as FTS syntax; * makes it a prefix match
+        terms = ['"%s"*' % term.replace('"', '""') for term in query.split()]
+        if not terms:
+            return []
+        rows = db.session.execute(db.text(
+            "SELECT blog_post.id, blog_post.title, blog_post.slug, blog_post.excerpt "
+            "FROM blog_fts JOIN blog_post ON blog_post.id = blog_fts.rowid "
+            "WHERE blog_fts MATCH :match AND blog_post.is_published = 1 "
+            "ORDER BY blog_fts.rank LIMIT :limit"
+        ), {'match': ' '.join(terms), 'limit': limit})
+        return rows.all()
+    
+    # Tag prefix matches come off the tag.name index; the title/content scan only
+    # runs when they don't fill the result
+    columns = (BlogPost.id, BlogPost.title, BlogPost.slug, BlogPost.excerpt)
+    rows = db.session.query(*columns).filter(
+        BlogPost.is_published == True,
+        BlogPost.id.in_(posts_tagged(query))
+    ).limit(limit).all()
+    if len(rows) < limit:
+        rows += db.session.query(*columns).filter(
+            BlogPost.is_published == True,
+            BlogPost.id.notin_([row.id for row in rows]),
+            db.or_(BlogPost.title.icontains(query), BlogPost.content.icontains(query))
+        ).limit(limit - len(rows)).all()
+    return rows
+
+
+def parse_tags(tags):
+    """Distinct lowercased names from a comma-separated tags value, in order"""
+    return list(dict.fromkeys(
+        name for name in (tag.strip().lower() for tag in (tags or '').split(',')) if name
+    ))
+
+
+def posts_tagged(prefix):
+    """Select of ids of posts with a tag starting with prefix, matched case-insensitively"""
+    prefix = prefix.strip().lower()
+    # A range rather than LIKE 'prefix%', so the unique tag.name index serves it
+    # whatever the column collation
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return db.select(blog_post_tag.c.post_id).join(
+        Tag, Tag.id == blog_post_tag.c.tag_id
+    ).where(Tag.name >= prefix, Tag.name < upper).distinct()
+
+
+def sync_post_tags(post):
+    """Rewrite the post's blog_post_tag rows from its comma-separated tags column"""
+    names = parse_tags(post.tags)
+    db.session.execute(blog_post_tag.delete().where(blog_post_tag.c.post_id == post.id))
+    if not names:
+        return
+    
+    tag_ids = dict(db.session.query(Tag.name, Tag.id).filter(Tag.name.in_(names)).all())
+    new_tags = [Tag(name=name) for name in names if name not in tag_ids]
+    if new_tags:
+        db.session.add_all(new_tags)
+        db.session.flush()
+        tag_ids.update((tag.name, tag.id) for tag in new_tags)
+    db.session.execute(blog_post_tag.insert(), [
+        {'tag_id': tag_ids[name], 'post_id': post.id} for name in names
+    ])
+
+
+BLOG_SEARCH_CACHE_TTL = 60  # seconds
+
+
+def normalize_search_query(query):
+    """Lowercase query with runs of whitespace collapsed - what is both searched and cached"""
+    return ' '.join(query.lower().split())
+
+
+def blog_search_cache_key(query):
+    """Cache key for a normalized search; the generation number changes whenever posts change"""
+    generation = cache.get('blog:search:generation') or 0
+    return f"blog:search:{generation}:{hashlib.sha1(query.encode()).hexdigest()}"
+
+
+def invalidate_blog_search_cache():
+    """Orphan every cached search result at once"""
+    cache.cache.inc('blog:search:generation')
+
+
+RELATED_SAMPLE_MIN = 20  # below this many candidates, ORDER BY RANDOM() is cheap enough
+
+
+def _related_filters(candidate, post):
+    return (
+        candidate.category_id == post.category_id,
+        candidate.is_published == True,
+        candidate.id != post.id,
+    )
+
+
+def related_count_column():
+    """COUNT of related candidates, correlated to the BlogPost being selected"""
+    candidate = aliased(BlogPost)
+    return db.select(db.func.count(candidate.id)).where(
+        *_related_filters(candidate, BlogPost)
+    ).scalar_subquery()
+
+
+def get_related_posts(post, related_count=None, limit=3):
+    """Pick random published posts from the same category as post
+    
+    related_count is the number of candidates, when the caller already
+    fetched it alongside the post via related_count_column().
+    """
+    filters = _related_filters(BlogPost, post)
+    if related_count is None:
+        related_count = db.session.query(db.func.count(BlogPost.id)).filter(*filters).scalar()
+    
+    if related_count < RELATED_SAMPLE_MIN:
+        return BlogPost.query.filter(*filters).order_by(db.func.random()).limit(limit).all()
+    
+    # Jump to random offsets along the (category_id, is_published, id) index instead
+    # of sorting the whole category - every offset below the count hits a row, and
+    # all the offset lookups go out as scalar subqueries of one statement
+    picked_ids = [
+        db.select(BlogPost.id).where(*filters).order_by(BlogPost.id).offset(offset).limit(1).scalar_subquery()
+        for offset in random.sample(range(related_count), min(limit, related_count))
+    ]
+    related = BlogPost.query.filter(BlogPost.id.in_(picked_ids)).all()
+    random.shuffle(related)
+    return related
+
+
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+# ASCII characters _SLUG_STRIP would remove, for the str.translate fast path
+_SLUG_ASCII_STRIP = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _SLUG_STRIP.match(c)
+))
+
+
+# Dialects whose INSERT supports ON CONFLICT DO UPDATE
+_UPSERT_INSERT = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+
+def bulk_update_settings(mapping):
+    """Update or create several settings in one statement and one commit"""
+    insert = _UPSERT_INSERT.get(db.engine.dialect.name)
+    if insert is None:
+        for key, value in mapping.items():
+            update_setting(key, value)
+        return
+    
+    now = datetime.utcnow()
+    stmt = insert(Settings).values([
+        {'key': key, 'value': value, 'description': '', 'updated_at': now}
+        for key, value in mapping.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Settings.key],
+        set_={'value': stmt.excluded.value, 'updated_at': stmt.excluded.updated_at},
+    )
+    db.session.execute(stmt)
+    db.session.commit()
+    _load_settings().update(mapping)
+
+
+def form_int(data, key, default=0):
+    """Integer form value, or default when missing or not a number"""
+    try:
+        return int(data.get(key) or default)
+    except ValueError:
+        return default
 
 
 def create_slug(text):
     """Create URL-friendly slug"""
-    import re
     text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
-    return text
+    if text.isascii():
+        text = text.translate(_SLUG_ASCII_STRIP)
+    else:
+        text = _SLUG_STRIP.sub('', text)
+    return _SLUG_DASH.sub('-', text)
 
 
 def init_default_data():
@@ -250,9 +816,10 @@ def init_default_data():
                 ('instagram_url', 'https://www.instagram.com/shramic.info', 'Instagram URL'),
                 ('github_url', 'https://github.com/Amit-Ashok-Swain', 'GitHub URL'),
             ]
-            for key, value, desc in default_settings:
-                setting = Settings(key=key, value=value, description=desc)
-                db.session.add(setting)
+            db.session.execute(db.insert(Settings), [
+                {'key': key, 'value': value, 'description': desc}
+                for key, value, desc in default_settings
+            ])
             print("✓ Default settings created")
         
         # Create default blog categories
@@ -263,9 +830,10 @@ def init_default_data():
                 ('Training', 'training', 'Farmer training and education'),
                 ('Market', 'market', 'Market insights and trends'),
             ]
-            for name, slug, desc in categories:
-                cat = BlogCategory(name=name, slug=slug, description=desc)
-                db.session.add(cat)
+            db.session.execute(db.insert(BlogCategory), [
+                {'name': name, 'slug': slug, 'description': desc}
+                for name, slug, desc in categories
+            ])
             print("✓ Blog categories created")
         
         # Create default statistics
@@ -276,9 +844,10 @@ def init_default_data():
                 ('Additional Income Generated', '₹2.5', 'Cr', 'fas fa-rupee-sign', 3),
                 ('Satisfaction Rate', '95', '%', 'fas fa-smile', 4),
             ]
-            for label, value, suffix, icon, order in stats:
-                stat = Statistic(label=label, value=value, suffix=suffix, icon=icon, order_index=order)
-                db.session.add(stat)
+            db.session.execute(db.insert(Statistic), [
+                {'label': label, 'value': value, 'suffix': suffix, 'icon': icon, 'order_index': order}
+                for label, value, suffix, icon, order in stats
+            ])
             print("✓ Statistics created")
         
         db.session.commit()
@@ -297,19 +866,10 @@ def init_default_data():
 def index():
     """Home page"""
     try:
-        hero = PageSection.query.filter_by(page='home', section_name='hero', is_active=True).first()
-        about_cards = PageSection.query.filter_by(page='home', section_name='about_card', is_active=True).order_by(PageSection.order_index).all()
-        features = Feature.query.filter_by(is_active=True).order_by(Feature.order_index).all()
-        stats = Statistic.query.filter_by(is_active=True).order_by(Statistic.order_index).all()
-        
-        return render_template('public/index.html',
-            hero=hero,
-            about_cards=about_cards,
-            features=features,
-            stats=stats
-        )
-    except Exception as e:
-        app.logger.error(f"Error loading home page: {e}")
+        payload = _home_payload()
+        return render_conditional(page_etag(payload), 'public/index.html', **payload)
+    except SQLAlchemyError:
+        app.logger.exception("Error loading home page")
         return render_template('public/index.html', hero=None, about_cards=[], features=[], stats=[])
 
 
@@ -317,23 +877,10 @@ def index():
 def about():
     """About page with team"""
     try:
-        story = PageSection.query.filter_by(page='about', section_name='story', is_active=True).first()
-        mission = PageSection.query.filter_by(page='about', section_name='mission', is_active=True).first()
-        vision = PageSection.query.filter_by(page='about', section_name='vision', is_active=True).first()
-        values = PageSection.query.filter_by(page='about', section_name='value', is_active=True).order_by(PageSection.order_index).all()
-        leadership = TeamMember.query.filter_by(is_leadership=True, is_active=True).order_by(TeamMember.order_index).all()
-        team = TeamMember.query.filter_by(is_leadership=False, is_active=True).order_by(TeamMember.order_index).all()
-        
-        return render_template('public/about.html',
-            story=story,
-            mission=mission,
-            vision=vision,
-            values=values,
-            leadership=leadership,
-            team=team
-        )
-    except Exception as e:
-        app.logger.error(f"Error loading about page: {e}")
+        payload = _about_payload()
+        return render_conditional(page_etag(payload), 'public/about.html', **payload)
+    except SQLAlchemyError:
+        app.logger.exception("Error loading about page")
         return render_template('public/about.html', story=None, mission=None, vision=None, values=[], leadership=[], team=[])
 
 
@@ -344,7 +891,16 @@ def blog():
         page = request.args.get('page', 1, type=int)
         category_slug = request.args.get('category', None)
         
-        query = BlogPost.query.filter_by(is_published=True)
+        # Any publish, edit or delete changes the newest updated_at or the count
+        last_updated, published_count = db.session.query(
+            db.func.max(BlogPost.updated_at), db.func.count(BlogPost.id)
+        ).filter_by(is_published=True).one()
+        etag = page_etag(last_updated, published_count, page, category_slug)
+        if etag in request.if_none_match:
+            return render_conditional(etag, 'public/blog.html')
+        
+        # Load categories in the same query; the listing shows each post's category
+        query = BlogPost.query.options(*BLOG_LIST_OPTIONS).filter_by(is_published=True)
         
         if category_slug:
             category = BlogCategory.query.filter_by(slug=category_slug).first()
@@ -356,16 +912,16 @@ def blog():
         )
         
         categories = BlogCategory.query.all()
-        featured_post = BlogPost.query.filter_by(is_published=True, is_featured=True).first()
+        featured_post = BlogPost.query.options(*BLOG_LIST_OPTIONS).filter_by(is_published=True, is_featured=True).first()
         
-        return render_template('public/blog.html',
+        return render_conditional(etag, 'public/blog.html',
             posts=posts,
             categories=categories,
             featured_post=featured_post,
             current_category=category_slug
         )
-    except Exception as e:
-        app.logger.error(f"Error loading blog page: {e}")
+    except SQLAlchemyError:
+        app.logger.exception("Error loading blog page")
         return render_template('public/blog.html', posts=None, categories=[], featured_post=None)
 
 
@@ -373,25 +929,26 @@ def blog():
 def blog_detail(slug):
     """Single blog post detail page"""
     try:
-        post = BlogPost.query.filter_by(slug=slug, is_published=True).first_or_404()
+        # The related-post count comes back in the same round trip as the post
+        row = db.session.query(BlogPost, related_count_column()).options(
+            joinedload(BlogPost.category), undefer(BlogPost.content)
+        ).filter(BlogPost.slug == slug, BlogPost.is_published == True).first()
+        if row is None:
+            abort(404)
+        post, related_count = row
         
-        # Increment views
-        post.views += 1
-        db.session.commit()
+        # Increment views - buffered, so the page shows the count including unwritten views
+        set_committed_value(post, 'views', (post.views or 0) + record_view(post.id))
         
         # Get related posts from same category
-        related_posts = BlogPost.query.filter(
-            BlogPost.id != post.id,
-            BlogPost.category_id == post.category_id,
-            BlogPost.is_published == True
-        ).order_by(db.func.random()).limit(3).all()
+        related_posts = get_related_posts(post, related_count)
         
         return render_template('public/blog_detail.html',
             post=post,
             related_posts=related_posts
         )
-    except Exception as e:
-        app.logger.error(f"Error loading blog detail: {e}")
+    except SQLAlchemyError:
+        app.logger.exception("Error loading blog detail")
         abort(404)
 
 
@@ -399,17 +956,10 @@ def blog_detail(slug):
 def testimonials():
     """Testimonials page"""
     try:
-        all_testimonials = Testimonial.query.filter_by(is_active=True).order_by(Testimonial.order_index).all()
-        featured = Testimonial.query.filter_by(is_active=True, is_featured=True).first()
-        stats = Statistic.query.filter_by(is_active=True).order_by(Statistic.order_index).all()
-        
-        return render_template('public/testimonial.html',
-            testimonials=all_testimonials,
-            featured=featured,
-            stats=stats
-        )
-    except Exception as e:
-        app.logger.error(f"Error loading testimonials page: {e}")
+        payload = _testimonials_payload()
+        return render_conditional(page_etag(payload), 'public/testimonial.html', **payload)
+    except SQLAlchemyError:
+        app.logger.exception("Error loading testimonials page")
         return render_template('public/testimonial.html', testimonials=[], featured=None, stats=[])
 
 
@@ -432,11 +982,18 @@ def admin_login():
     if request.method == 'POST':
         try:
             username = request.form.get('username')
-            password = request.form.get('password')
+            password = request.form.get('password', '')
             
             user = User.query.filter_by(username=username).first()
+            # Unknown usernames are checked against the dummy hash so both paths cost one KDF call
+            stored_hash = user.password_hash if user else _DUMMY_PASSWORD_HASH
+            valid = _kdf_pool.submit(verify_password_hash, stored_hash, password).result() and user is not None
             
-            if user and user.check_password(password):
+            if valid:
+                if user.password_needs_rehash():
+                    # The rehash is a full KDF run too, so it shares the pool's memory cap
+                    user.password_hash = _kdf_pool.submit(password_hasher.hash, password).result()
+                    db.session.commit()
                 session['user_id'] = user.id
                 session['username'] = user.username
                 flash('Login successful!', 'success')
@@ -468,15 +1025,28 @@ def admin_logout():
 def admin_dashboard():
     """Admin dashboard"""
     try:
+        # All four counts in one round trip
+        counts = db.session.execute(db.select(
+            db.select(db.func.count(BlogPost.id)).scalar_subquery(),
+            db.select(db.func.count(BlogPost.id)).filter_by(is_published=True).scalar_subquery(),
+            db.select(db.func.count(Testimonial.id)).filter_by(is_active=True).scalar_subquery(),
+            db.select(db.func.count(TeamMember.id)).filter_by(is_active=True).scalar_subquery(),
+        )).one()
+        
         stats = {
-            'total_posts': BlogPost.query.count(),
-            'published_posts': BlogPost.query.filter_by(is_published=True).count(),
-            'total_testimonials': Testimonial.query.filter_by(is_active=True).count(),
-            'team_members': TeamMember.query.filter_by(is_active=True).count(),
+            'total_posts': counts[0],
+            'published_posts': counts[1],
+            'total_testimonials': counts[2],
+            'team_members': counts[3],
         }
         
-        recent_posts = BlogPost.query.order_by(BlogPost.created_at.desc()).limit(5).all()
-        recent_testimonials = Testimonial.query.order_by(Testimonial.created_at.desc()).limit(5).all()
+        # Plain rows, not ORM instances - the dashboard only reads a few columns
+        recent_posts = db.session.query(
+            BlogPost.id, BlogPost.title, BlogPost.is_published, BlogPost.created_at
+        ).order_by(BlogPost.created_at.desc()).limit(5).all()
+        recent_testimonials = db.session.query(
+            Testimonial.id, Testimonial.name, Testimonial.location, Testimonial.rating
+        ).order_by(Testimonial.created_at.desc()).limit(5).all()
         
         return render_template('admin/dashboard.html',
             stats=stats,
@@ -512,6 +1082,7 @@ def admin_edit_home():
             hero.button_link = request.form.get('hero_button_link')
             
             db.session.commit()
+            invalidate_page_cache()
             flash('Home page updated successfully!', 'success')
             return redirect(url_for('admin_edit_home'))
         except Exception as e:
@@ -553,6 +1124,7 @@ def admin_edit_about():
             page_section.image_url = request.form.get('image_url')
             
             db.session.commit()
+            invalidate_page_cache()
             flash(f'{section.title()} section updated successfully!', 'success')
             return redirect(url_for('admin_edit_about'))
         except Exception as e:
@@ -583,10 +1155,14 @@ def admin_manage_blog():
     """Manage all blog posts"""
     try:
         page = request.args.get('page', 1, type=int)
-        posts = BlogPost.query.order_by(BlogPost.created_at.desc()).paginate(
+        posts = BlogPost.query.options(*BLOG_LIST_OPTIONS).order_by(BlogPost.created_at.desc()).paginate(
             page=page, per_page=20, error_out=False
         )
-        categories = BlogCategory.query.all()
+        
+        # (category, post_count) pairs - counted in SQL instead of loading every post
+        categories = db.session.query(BlogCategory, db.func.count(BlogPost.id)).outerjoin(
+            BlogCategory.posts
+        ).group_by(BlogCategory.id).all()
         
         return render_template('admin/manage_blog.html',
             posts=posts,
@@ -603,7 +1179,7 @@ def admin_manage_blog():
 @login_required
 def admin_edit_blog(id=None):
     """Create or edit blog post"""
-    post = BlogPost.query.get(id) if id else None
+    post = BlogPost.query.options(undefer(BlogPost.content)).get(id) if id else None
     
     if request.method == 'POST':
         try:
@@ -627,7 +1203,10 @@ def admin_edit_blog(id=None):
             if post.is_published and not post.published_at:
                 post.published_at = datetime.utcnow()
             
+            db.session.flush()  # assigns the id of a new post
+            sync_post_tags(post)
             db.session.commit()
+            invalidate_blog_search_cache()
             flash('Blog post saved successfully!', 'success')
             return redirect(url_for('admin_manage_blog'))
         except Exception as e:
@@ -645,8 +1224,11 @@ def admin_delete_blog(id):
     """Delete blog post"""
     try:
         post = BlogPost.query.get_or_404(id)
+        # SQLite doesn't enforce the ON DELETE CASCADE, so clear the tag links here
+        db.session.execute(blog_post_tag.delete().where(blog_post_tag.c.post_id == post.id))
         db.session.delete(post)
         db.session.commit()
+        invalidate_blog_search_cache()
         flash('Blog post deleted successfully!', 'success')
     except Exception as e:
         db.session.rollback()
@@ -701,6 +1283,7 @@ def admin_edit_testimonial(id=None):
             testimonial.order_index = request.form.get('order_index', 0, type=int)
             
             db.session.commit()
+            invalidate_page_cache()
             flash('Testimonial saved successfully!', 'success')
             return redirect(url_for('admin_manage_testimonials'))
         except Exception as e:
@@ -719,6 +1302,7 @@ def admin_delete_testimonial(id):
         testimonial = Testimonial.query.get_or_404(id)
         db.session.delete(testimonial)
         db.session.commit()
+        invalidate_page_cache()
         flash('Testimonial deleted successfully!', 'success')
     except Exception as e:
         db.session.rollback()
@@ -737,14 +1321,24 @@ def admin_delete_testimonial(id):
 def admin_manage_team():
     """Manage team members"""
     try:
-        team_members = TeamMember.query.order_by(TeamMember.order_index).all()
-        return render_template('admin/manage_team.html', team_members=team_members)
+        # Everything the list shows; bio is only needed on the edit form
+        team_members = db.session.query(
+            TeamMember.id, TeamMember.name, TeamMember.position, TeamMember.photo_url,
+            TeamMember.email, TeamMember.linkedin, TeamMember.twitter,
+            TeamMember.order_index, TeamMember.is_leadership, TeamMember.is_active
+        ).order_by(TeamMember.order_index).all()
+        return render_admin_conditional('admin/manage_team.html', team_members=team_members,
+                                        team_version=rows_version(team_members))
     except Exception as e:
         app.logger.error(f"Error loading team members: {e}")
         flash('Error loading team members', 'danger')
         return render_template('admin/manage_team.html', team_members=[])
 
 
+# Team member columns copied straight from the edit form
+TEAM_MEMBER_TEXT_FIELDS = ('name', 'position', 'bio', 'photo_url', 'email', 'linkedin', 'twitter')
+
+
 @app.route('/admin/team/new', methods=['GET', 'POST'])
 @app.route('/admin/team/edit/<int:id>', methods=['GET', 'POST'])
 @login_required
@@ -758,18 +1352,15 @@ def admin_edit_team(id=None):
                 member = TeamMember()
                 db.session.add(member)
             
-            member.name = request.form.get('name')
-            member.position = request.form.get('position')
-            member.bio = request.form.get('bio')
-            member.photo_url = request.form.get('photo_url')
-            member.email = request.form.get('email')
-            member.linkedin = request.form.get('linkedin')
-            member.twitter = request.form.get('twitter')
-            member.is_leadership = request.form.get('is_leadership') == 'on'
-            member.is_active = request.form.get('is_active') == 'on'
-            member.order_index = request.form.get('order_index', 0, type=int)
+            data = request.form.to_dict()
+            for field in TEAM_MEMBER_TEXT_FIELDS:
+                setattr(member, field, data.get(field))
+            member.is_leadership = data.get('is_leadership') == 'on'
+            member.is_active = data.get('is_active') == 'on'
+            member.order_index = form_int(data, 'order_index')
             
             db.session.commit()
+            invalidate_page_cache()
             flash('Team member saved successfully!', 'success')
             return redirect(url_for('admin_manage_team'))
         except Exception as e:
@@ -785,15 +1376,19 @@ def admin_edit_team(id=None):
 def admin_delete_team(id):
     """Delete team member"""
     try:
-        member = TeamMember.query.get_or_404(id)
-        db.session.delete(member)
+        # Single DELETE ... WHERE id - nothing hangs off this row, no need to load it first
+        deleted = TeamMember.query.filter_by(id=id).delete(synchronize_session=False)
         db.session.commit()
-        flash('Team member deleted successfully!', 'success')
     except Exception as e:
         db.session.rollback()
         app.logger.error(f"Error deleting team member: {e}")
         flash(f'Error: {str(e)}', 'danger')
+        return redirect(url_for('admin_manage_team'))
     
+    if not deleted:
+        abort(404)
+    invalidate_page_cache()
+    flash('Team member deleted successfully!', 'success')
     return redirect(url_for('admin_manage_team'))
 
 
@@ -823,6 +1418,7 @@ def admin_manage_stats():
             stat.is_active = request.form.get('is_active') == 'on'
             
             db.session.commit()
+            invalidate_page_cache()
             flash('Statistic saved successfully!', 'success')
             return redirect(url_for('admin_manage_stats'))
         except Exception as e:
@@ -830,8 +1426,11 @@ def admin_manage_stats():
             app.logger.error(f"Error saving statistic: {e}")
             flash(f'Error: {str(e)}', 'danger')
     
-    stats = Statistic.query.order_by(Statistic.order_index).all()
-    return render_template('admin/manage_stats.html', stats=stats)
+    stats = db.session.query(
+        Statistic.id, Statistic.label, Statistic.value, Statistic.suffix,
+        Statistic.icon, Statistic.order_index, Statistic.is_active
+    ).order_by(Statistic.order_index).all()
+    return render_admin_conditional('admin/manage_stats.html', stats=stats, stats_version=rows_version(stats))
 
 
 @app.route('/admin/stats/delete/<int:id>', methods=['POST'])
@@ -839,15 +1438,19 @@ def admin_manage_stats():
 def admin_delete_stat(id):
     """Delete statistic"""
     try:
-        stat = Statistic.query.get_or_404(id)
-        db.session.delete(stat)
+        # Single DELETE ... WHERE id - nothing hangs off this row, no need to load it first
+        deleted = Statistic.query.filter_by(id=id).delete(synchronize_session=False)
         db.session.commit()
-        flash('Statistic deleted successfully!', 'success')
     except Exception as e:
         db.session.rollback()
         app.logger.error(f"Error deleting statistic: {e}")
         flash(f'Error: {str(e)}', 'danger')
+        return redirect(url_for('admin_manage_stats'))
     
+    if not deleted:
+        abort(404)
+    invalidate_page_cache()
+    flash('Statistic deleted successfully!', 'success')
     return redirect(url_for('admin_manage_stats'))
 
 
@@ -861,77 +1464,102 @@ def admin_settings():
     """Manage site settings"""
     if request.method == 'POST':
         try:
-            settings_data = {
-                'site_title': request.form.get('site_title'),
-                'site_tagline': request.form.get('site_tagline'),
-                'contact_email': request.form.get('contact_email'),
-                'contact_phone': request.form.get('contact_phone'),
-                'contact_address': request.form.get('contact_address'),
-                'facebook_url': request.form.get('facebook_url'),
-                'twitter_url': request.form.get('twitter_url'),
-                'linkedin_url': request.form.get('linkedin_url'),
-                'instagram_url': request.form.get('instagram_url'),
-                'github_url': request.form.get('github_url'),
-            }
-            
-            for key, value in settings_data.items():
-                update_setting(key, value)
+            settings_data = {key: request.form.get(key) for key in SITE_SETTING_KEYS}
+            bulk_update_settings(settings_data)
             
             flash('Settings updated successfully!', 'success')
             return redirect(url_for('admin_settings'))
         except Exception as e:
+            db.session.rollback()
             app.logger.error(f"Error updating settings: {e}")
             flash(f'Error: {str(e)}', 'danger')
     
-    settings = {
-        'site_title': get_setting('site_title'),
-        'site_tagline': get_setting('site_tagline'),
-        'contact_email': get_setting('contact_email'),
-        'contact_phone': get_setting('contact_phone'),
-        'contact_address': get_setting('contact_address'),
-        'facebook_url': get_setting('facebook_url'),
-        'twitter_url': get_setting('twitter_url'),
-        'linkedin_url': get_setting('linkedin_url'),
-        'instagram_url': get_setting('instagram_url'),
-        'github_url': get_setting('github_url'),
-    }
-    
+    # Read the table, not the per-process cache, so the form never shows (and
+    # re-saves) values another worker has already replaced
+    stored = dict(db.session.query(Settings.key, Settings.value).all())
+    settings = {key: stored.get(key, '') for key in SITE_SETTING_KEYS}
     return render_template('admin/settings.html', settings=settings)
 
 
+# =============================================================================
+# RESPONSE HEADERS
+# =============================================================================
+
+@app.after_request
+def cache_uploads(response):
+    """Uploaded media never changes in place, so browsers need not revalidate it"""
+    if request.path.startswith('/static/uploads/') and response.status_code in (200, 304):
+        response.cache_control.public = True
+        response.cache_control.max_age = app.config['SEND_FILE_MAX_AGE_DEFAULT']
+        response.cache_control.immutable = True
+    return response
+
+
 # =============================================================================
 # ERROR HANDLERS
 # =============================================================================
 
+# template -> (settings version, rendered bytes)
+_error_pages = {}
+
+
+def error_response(template, status):
+    """Serve an error page from bytes rendered once per settings version
+    
+    Scanner floods of 404s never reach Jinja, and a 500 caused by the database
+    still gets the last good page when the settings can't be read.
+    """
+    try:
+        version = page_etag(template)
+    except SQLAlchemyError:
+        version = None
+    cached = _error_pages.get(template)
+    if cached is None or (version is not None and cached[0] != version):
+        # Fresh context on a path no route matches, so no nav link renders as active
+        with app.test_request_context('/error'):
+            cached = _error_pages[template] = (version, render_template(template).encode())
+    return app.response_class(cached[1], status=status, mimetype='text/html')
+
+
 @app.errorhandler(404)
 def not_found_error(error):
     """Handle 404 errors"""
-    return render_template('public/404.html'), 404
+    return error_response('public/404.html', 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    db.session.rollback()
-    return render_template('public/500.html'), 500
+    # No rollback here: Flask-SQLAlchemy removes the request's session on teardown,
+    # which rolls back whatever the failed request left open
+    return error_response('public/500.html', 500)
 
 
 @app.errorhandler(403)
 def forbidden_error(error):
     """Handle 403 errors"""
-    return render_template('public/404.html'), 403
+    return error_response('public/404.html', 403)
 
 
 # =============================================================================
 # TEMPLATE FILTERS
 # =============================================================================
 
+@lru_cache(maxsize=4096)
+def _strftime(value, format):
+    return value.strftime(format)
+
+
 @app.template_filter('datetime')
 def format_datetime(value, format='%B %d, %Y'):
     """Format datetime objects"""
     if value is None:
         return ''
-    return value.strftime(format)
+    # The same post and testimonial dates are formatted on every page view
+    return _strftime(value, format)
+
+
+_WORD = re.compile(r'\S+')
 
 
 @app.template_filter('truncate_words')
@@ -939,7 +1567,8 @@ def truncate_words(text, length=50):
     """Truncate text to specified number of words"""
     if not text:
         return ''
-    words = text.split()
+    # Scan only as far as needed to know whether text is longer than length words
+    words = [match.group() for match in islice(_WORD.finditer(text), length + 1)]
     if len(words) <= length:
         return text
     return ' '.join(words[:length]) + '...'
@@ -949,24 +1578,21 @@ def truncate_words(text, length=50):
 # CONTEXT PROCESSOR
 # =============================================================================
 
+app.jinja_env.globals['get_setting'] = get_setting
+
+
 @app.context_processor
 def inject_settings():
-    """Inject settings into all templates"""
-    try:
-        return {
-            'site_title': get_setting('site_title', 'Shramic Networks'),
-            'site_tagline': get_setting('site_tagline', 'Empowering Agriculture Through Innovation'),
-            'contact_email': get_setting('contact_email'),
-            'contact_phone': get_setting('contact_phone'),
-            'contact_address': get_setting('contact_address'),
-            'facebook_url': get_setting('facebook_url'),
-            'twitter_url': get_setting('twitter_url'),
-            'linkedin_url': get_setting('linkedin_url'),
-            'instagram_url': get_setting('instagram_url'),
-            'github_url': get_setting('github_url'),
-        }
-    except:
-        return {}
+    """Inject settings into all templates, built once per request"""
+    if 'site_settings' not in g:
+        try:
+            g.site_settings = get_all_settings({
+                'site_title': 'Shramic Networks',
+                'site_tagline': 'Empowering Agriculture Through Innovation',
+            })
+        except SQLAlchemyError:
+            return {}
+    return g.site_settings
 
 
 # =============================================================================
@@ -977,30 +1603,31 @@ def inject_settings():
 def api_blog_search():
     """Search blog posts"""
     try:
-        query = request.args.get('q', '')
+        # Search with the same normalized string the cache is keyed on
+        query = normalize_search_query(request.args.get('q', ''))
         if not query:
             return jsonify([])
         
-        posts = BlogPost.query.filter(
-            BlogPost.is_published == True,
-            db.or_(
-                BlogPost.title.contains(query),
-                BlogPost.content.contains(query),
-                BlogPost.tags.contains(query)
-            )
-        ).limit(10).all()
-        
-        results = [{
-            'id': post.id,
-            'title': post.title,
-            'slug': post.slug,
-            'excerpt': post.excerpt,
-            'url': url_for('blog_detail', slug=post.slug)
-        } for post in posts]
+        # Autocomplete repeats the same prefixes; cache the serialized response body
+        cache_key = blog_search_cache_key(query)
+        body = cache.get(cache_key)
+        if body is None:
+            # One round trip straight to the columns the response needs
+            posts = search_published_posts(query)
+            results = [{
+                'id': post.id,
+                'title': post.title,
+                'slug': post.slug,
+                'excerpt': post.excerpt,
+                'url': url_for('blog_detail', slug=post.slug)
+            } for post in posts]
+            
+            body = orjson.dumps(results)
+            cache.set(cache_key, body, timeout=BLOG_SEARCH_CACHE_TTL)
         
-        return jsonify(results)
-    except Exception as e:
-        app.logger.error(f"Search error: {e}")
+        return app.response_class(body, mimetype='application/json')
+    except SQLAlchemyError:
+        app.logger.exception("Search error")
         return jsonify([]), 500
 
 
@@ -1008,10 +1635,91 @@ def api_blog_search():
 # DATABASE INITIALIZATION
 # =============================================================================
 
+def create_missing_indexes():
+    """Create model indexes on tables that predate them (create_all skips existing tables)"""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+
+
+# SQLite FTS5 index over blog_post, kept in sync by triggers
+_BLOG_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS blog_fts USING fts5("
+    "title, content, tags, content='blog_post', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS blog_fts_ai AFTER INSERT ON blog_post BEGIN "
+    "INSERT INTO blog_fts(rowid, title, content, tags) VALUES (new.id, new.title, new.content, new.tags); END",
+    "CREATE TRIGGER IF NOT EXISTS blog_fts_ad AFTER DELETE ON blog_post BEGIN "
+    "INSERT INTO blog_fts(blog_fts, rowid, title, content, tags) VALUES ('delete', old.id, old.title, old.content, old.tags); END",
+    # Only text columns - view count flushes must not re-index posts
+    "CREATE TRIGGER IF NOT EXISTS blog_fts_au AFTER UPDATE OF title, content, tags ON blog_post BEGIN "
+    "INSERT INTO blog_fts(blog_fts, rowid, title, content, tags) VALUES ('delete', old.id, old.title, old.content, old.tags); "
+    "INSERT INTO blog_fts(rowid, title, content, tags) VALUES (new.id, new.title, new.content, new.tags); END",
+)
+
+
+def create_search_index():
+    """Create the blog full-text index on SQLite, indexing existing posts the first time"""
+    global _blog_fts_ready
+    if db.engine.dialect.name != 'sqlite' or blog_fts_available():
+        return
+    try:
+        for ddl in _BLOG_FTS_DDL:
+            db.session.execute(db.text(ddl))
+        db.session.execute(db.text("INSERT INTO blog_fts(blog_fts) VALUES ('rebuild')"))
+        db.session.commit()
+        _blog_fts_ready = True
+    except SQLAlchemyError as e:
+        # SQLite built without FTS5 - search keeps using LIKE
+        db.session.rollback()
+        print(f"Full-text search index not created: {e}")
+
+
+def create_tag_index():
+    """Fill the tag tables from BlogPost.tags on databases that predate them
+
+    Safe to call on every start: it does nothing once the tables hold rows.
+    """
+    try:
+        if db.session.query(blog_post_tag.c.post_id).first() is not None:
+            return
+        for post in BlogPost.query.options(load_only(BlogPost.id, BlogPost.tags)).filter(
+            BlogPost.tags.isnot(None), BlogPost.tags != ''
+        ).all():
+            sync_post_tags(post)
+        db.session.commit()
+    except SQLAlchemyError as e:
+        # Another worker starting at the same moment may have won the race
+        db.session.rollback()
+        print(f"Tag index not filled: {e}")
+
+
+def upgrade_db():
+    """Bring an existing database up to the current schema: tables, indexes, search index, tags"""
+    db.create_all()  # tables added since the database was made, before their indexes
+    create_missing_indexes()
+    create_search_index()
+    create_tag_index()
+    if db.engine.dialect.name == 'sqlite':
+        # Refresh planner statistics against the data this deploy actually serves
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql("PRAGMA optimize")
+
+
+@app.cli.command('upgrade-db')
+def upgrade_db_command():
+    """Create or upgrade the database - run before starting `gunicorn app:app`"""
+    if db.inspect(db.engine).has_table(BlogPost.__tablename__):
+        upgrade_db()
+        print("Database upgraded.")
+    else:
+        init_db()
+        print("Database initialized.")
+
+
 def init_db():
     """Initialize database"""
     with app.app_context():
-        db.create_all()
+        upgrade_db()
         init_default_data()
 
 
@@ -1049,6 +1757,8 @@ if __name__ == '__main__':
             import sys
             sys.exit(1)
     else:
+        with app.app_context():
+            upgrade_db()
         print("="*60)
         print("🚀 SHRAMIC NETWORKS CMS")
         print("="*60)
@@ -1057,7 +1767,7 @@ if __name__ == '__main__':
         print("   - Admin: http://localhost:5000/admin/login")
         print("="*60 + "\n")
     
-    # Run the application
+    # Run the development server - production runs `gunicorn app:app` with gunicorn.conf.py
     try:
         app.run(debug=True, host='0.0.0.0', port=int(os.environ.get("PORT", 10000)))
     except Exception as e:
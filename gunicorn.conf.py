@@ -0,0 +1,17 @@
+"""
+Gunicorn settings - picked up automatically by `gunicorn app:app`
+==================================================================
+Threaded workers let one process serve other requests while a request
+waits on the database or the password KDF (argon2 releases the GIL).
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '10000')}"
+worker_class = 'gthread'
+# One process by default: settings and page payloads are cached per process,
+# so a second worker would keep serving stale copies after an admin save
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+timeout = 30
+keepalive = 5